@@ -119,6 +119,17 @@ REST_FRAMEWORK = {
 }
 # endregion -------------------------------------------------------------------------
 
+# region -------------------------- PASSWORD HASHERS --------------------------------
+# Argon2id is the primary hasher (time_cost=2, memory_cost=102400, parallelism=8).
+# Existing PBKDF2 hashes are upgraded automatically on the next successful login.
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+# endregion -------------------------------------------------------------------------
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
@@ -4,6 +4,7 @@ from typing import Optional
 
 from django.contrib.auth import get_user_model
 from django.db.models import Q
+from django.db.models.functions import Lower
 from rest_framework.request import Request
 
 User = get_user_model()
@@ -41,9 +42,9 @@ class AuthBackend(object):
         """Check one of the authentication choices and password."""
 
         try:
-            user = User.objects.get(
+            user = User.objects.alias(email_lower=Lower('email')).get(
                 Q(username=username) |
-                Q(email=username) |
+                Q(email_lower=username.lower()) |
                 Q(phone_number=username)
             )
         except User.DoesNotExist:
@@ -0,0 +1,30 @@
+from django.contrib.auth import get_user_model
+from django.core.management import BaseCommand, CommandError
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.db.models.functions import Lower
+
+
+class Command(BaseCommand):
+    """
+    Command for lowercasing stored user emails
+    """
+
+    def handle(self, *args, **options):
+        """
+        Method to run a custom command.
+        """
+        User = get_user_model()
+        users = User.objects.filter(email__isnull=False).alias(
+            email_lower=Lower('email')
+        ).exclude(email=F('email_lower'))
+        try:
+            with transaction.atomic():
+                updated = users.update(email=Lower('email'))
+        except IntegrityError:
+            raise CommandError(
+                'Some emails differ only in case, resolve them and run again'
+            )
+        self.stdout.write(
+            self.style.SUCCESS(f'Lowercased {updated} user emails')
+        )
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
-from typing import Union, Optional, TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterable, Union, Optional, TYPE_CHECKING
 
+from django.apps import apps
 from django.contrib.auth import get_user_model
 from django.contrib.auth.base_user import BaseUserManager
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
 from rest_framework.exceptions import ParseError
 
 if TYPE_CHECKING:
@@ -28,35 +32,46 @@ class CustomUserManager(BaseUserManager):
         """Check if email or phone number is provided."""
         return email or phone_number
 
-    def __create_user(
+    def __build_user(
             self,
             phone_number: Optional[str] = None,
             email: Optional[str] = None,
-            password: Optional[str] = None,
             username: Optional[str] = None,
             **extra_fields: Optional[str]
     ) -> User:
-        """Validate user or superuser data."""
+        """Validate user or superuser data and build an unsaved instance."""
         if not (email or phone_number or username):
             raise ParseError('Specify email or phone number')
 
         if email:
-            email = self.normalize_email(email)
+            email = self.normalize_email(email).lower()
 
         if not username:
             value = self.__check_email_or_phone_number(email, phone_number)
-            username = value.split('@')[0] if '@' in value else value
+            username = value.partition('@')[0]
 
-        user = self.model(username=username, **extra_fields)
+        fields = {'username': username, **extra_fields}
         if email:
-            user.email = email
+            fields['email'] = email
         if phone_number:
-            user.phone_number = phone_number
-        if user.is_superuser:
-            user.role = user.Role.ADMIN
+            fields['phone_number'] = phone_number
+        if fields.get('is_superuser'):
+            fields['role'] = self.model.Role.ADMIN
+
+        return self.model(**fields)
 
+    def __create_user(
+            self,
+            phone_number: Optional[str] = None,
+            email: Optional[str] = None,
+            password: Optional[str] = None,
+            username: Optional[str] = None,
+            **extra_fields: Optional[str]
+    ) -> User:
+        """Validate user or superuser data."""
+        user = self.__build_user(phone_number, email, username, **extra_fields)
         user.set_password(password)
-        user.save(using=self._db)
+        user.save(using=self._db, force_insert=True)
         return user
 
     def create_user(
@@ -75,7 +90,80 @@ class CustomUserManager(BaseUserManager):
             phone_number, email, password, username, **extra_fields
         )
 
+    def bulk_create_users(
+            self,
+            users_data: Iterable[dict[str, Any]],
+            batch_size: int = 1000,
+            max_workers: int = 2,
+    ) -> list[User]:
+        """
+        Create users in bulk, skipping conflicting rows.
+
+        Each Argon2 hash in the `max_workers` pool holds ~100 MiB of memory.
+        The returned instances have no pk set.
+        """
+        users_data = [dict(data) for data in users_data]
+        passwords = [data.pop('password', None) for data in users_data]
+        users = [
+            self.__build_user(**{'is_superuser': False, 'is_active': True, **data})
+            for data in users_data
+        ]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for user, password in zip(users, executor.map(make_password, passwords)):
+                user.password = password
+
+        # bulk_create does not send post_save, so profiles are created here.
+        usernames = [user.username for user in users]
+        profile_model = apps.get_model('users', 'Profile')
+        with transaction.atomic(using=self._db):
+            self.bulk_create(users, batch_size=batch_size, ignore_conflicts=True)
+            for start in range(0, len(usernames), batch_size):
+                user_ids = self.filter(
+                    username__in=usernames[start:start + batch_size],
+                    profile__isnull=True,
+                ).values_list('pk', flat=True)
+                profile_model.objects.using(self._db).bulk_create(
+                    [profile_model(user_id=user_id) for user_id in user_ids]
+                )
+        return users
+
+    def upsert_user(
+            self,
+            email: str,
+            password: Optional[str] = None,
+            **extra_fields: Union[str, bool],
+    ) -> User:
+        """
+        Create a user or update the one with the same email.
 
+        Only the given phone number and names are overwritten. Conflicts on
+        another user's username or phone number raise IntegrityError.
+        """
+        extra_fields.setdefault('is_superuser', False)
+        extra_fields.setdefault('is_active', True)
+
+        user = self.__build_user(email=email, **extra_fields)
+        user.set_password(password)
+        update_fields = [
+            field for field in ('phone_number', 'first_name', 'last_name')
+            if field in extra_fields
+        ] or ['email']
+
+        profile_model = apps.get_model('users', 'Profile')
+        with transaction.atomic(using=self._db):
+            self.bulk_create(
+                [user],
+                update_conflicts=True,
+                unique_fields=['email'],
+                update_fields=update_fields,
+            )
+            profile_model.objects.using(self._db).bulk_create(
+                [profile_model(user_id=user.pk)], ignore_conflicts=True
+            )
+            # Replace the submitted data with the stored row.
+            user.refresh_from_db(using=self._db)
+        return user
 
     def create_superuser(
                 self,
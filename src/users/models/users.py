@@ -1,5 +1,6 @@
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.db.models.functions import Lower
 from django.utils.translation import gettext_lazy as _
 from django.db.models.signals import post_save
 from django.dispatch import receiver
@@ -19,6 +20,8 @@ class User(AbstractUser):
         ADMIN = 'ADM', _('Administrator')
         AUTHOR = 'AUT', _('Author')
 
+    ROLE_VALUES = frozenset(Role.values)
+
     username = models.CharField(
         verbose_name='Username',
         max_length=32,
@@ -55,6 +58,9 @@ class User(AbstractUser):
     class Meta:
         verbose_name = 'User'
         verbose_name_plural = 'Users'
+        constraints = [
+            models.UniqueConstraint(Lower('email'), name='uniq_user_email_lower'),
+        ]
 
     @property
     def full_name(self) -> str:
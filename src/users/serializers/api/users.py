@@ -1,10 +1,11 @@
 from typing import Optional
 
-from crum import get_current_user
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
-from django.db import transaction
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import IntegrityError, transaction
 from djoser import serializers as djoser_serializers
+from djoser.conf import settings as djoser_settings
 from rest_framework import serializers
 from rest_framework.exceptions import ParseError
 from rest_framework.response import Response
@@ -16,7 +17,7 @@ from users.serializers.nested.profile import ProfileShortSerializer, ProfileUpda
 User = get_user_model()
 
 
-class RegistrationSerializer(djoser_serializers.UserCreateSerializer):
+class RegistrationSerializer(serializers.ModelSerializer):
     """
     User registration serializer.
     """
@@ -27,17 +28,31 @@ class RegistrationSerializer(djoser_serializers.UserCreateSerializer):
         write_only=True,
     )
 
-    class Meta(djoser_serializers.UserCreateSerializer.Meta):
+    class Meta:
         model = User
         fields = ('id', 'first_name', 'last_name', 'username','email', 'password', )
 
     @staticmethod
     def validate_email(value: str) -> str:
-        """Ensure email uniqueness."""
-        email = value.lower()
-        if User.objects.filter(email=email).exists():
-            raise ParseError('A user with this email is already registered.')
-        return email
+        """Normalize email, uniqueness is enforced by the database."""
+        return value.lower()
+
+    def validate(self, attrs: dict[str, str]) -> dict[str, str]:
+        """Validate the password against the user's attributes."""
+        try:
+            validate_password(password=attrs['password'], user=User(**attrs))
+        except DjangoValidationError as exc:
+            raise serializers.ValidationError({'password': list(exc.messages)})
+        return attrs
+
+    def create(self, validated_data: dict[str, str]) -> User:
+        """Create a user, relying on the email unique constraint."""
+        validated_data['is_active'] = not djoser_settings.SEND_ACTIVATION_EMAIL
+        try:
+            with transaction.atomic():
+                return User.objects.create_user(**validated_data)
+        except IntegrityError:
+            raise ParseError('A user with this email or username is already registered.')
 
     # def create(self, validated_data):
     #     """Creating user with jwt tokens in cookies"""
@@ -68,6 +83,7 @@ class UserSerializer(serializers.ModelSerializer):
             'profile',
             'date_joined',
         )
+        read_only_fields = ('id', 'date_joined')
 
 #
 # class CustomActivationSerializer(djoser_serializers.ActivationSerializer):
@@ -94,7 +110,7 @@ class ChangePasswordSerializer(serializers.ModelSerializer):
 
     def validate(self, attrs: dict[str, str]) -> dict[str, str]:
         """Проверка на корректность """
-        user = get_current_user()
+        user = self.context['request'].user
         old_password = attrs.pop('old_password')
         if not user.check_password(raw_password=old_password):
             raise ParseError('Проверьте правильность текущего пароля!')
@@ -111,7 +127,7 @@ class ChangePasswordSerializer(serializers.ModelSerializer):
         password = validated_data.pop('new_password')
         # Хэшируем пароль
         instance.set_password(raw_password=password)
-        instance.save()
+        instance.save(update_fields=('password',))
         return instance
 
 
@@ -146,6 +162,14 @@ class UserUpdateSerializer(serializers.ModelSerializer):
             'username',
             'profile',
         )
+        read_only_fields = ('id',)
+        # Email uniqueness is enforced by the database, see `update`.
+        extra_kwargs = {'email': {'validators': []}}
+
+    @staticmethod
+    def validate_email(value: Optional[str]) -> Optional[str]:
+        """Normalize email the same way as on registration."""
+        return value.lower() if value else value
 
     @staticmethod
     def _update_profile(profile: Profile, data: Optional[str]) -> None:
@@ -154,18 +178,31 @@ class UserUpdateSerializer(serializers.ModelSerializer):
             instance=profile, data=data, partial=True
         )
         profile_serializer.is_valid(raise_exception=True)
-        profile_serializer.save()
+        validated_data = profile_serializer.validated_data
+        for field, value in validated_data.items():
+            setattr(profile, field, value)
+        # Обновляем только переданные поля.
+        profile.save(update_fields=validated_data.keys())
 
     def update(self, instance: User, validated_data: dict[str, str]) -> User:
         """Update user model and related profile."""
         profile_data = validated_data.pop('profile', None)
 
-        with transaction.atomic():
-            instance = super().update(
-                instance=instance, validated_data=validated_data
-            )
-            if profile_data:
+        try:
+            if not profile_data:
+                return super().update(
+                    instance=instance, validated_data=validated_data
+                )
+
+            with transaction.atomic():
+                instance = super().update(
+                    instance=instance, validated_data=validated_data
+                )
                 self._update_profile(instance.profile, profile_data)
+        except IntegrityError:
+            raise ParseError(
+                'A user with this email, username or phone number is already registered.'
+            )
 
         return instance
 
@@ -181,12 +218,11 @@ class UserUpdateRoleSerializer(serializers.ModelSerializer):
         """Обновление роли пользователя."""
         current_role = validated_data.pop('role')
         # Проверка на существующую роль.
-        if not any((current_role == role for role, _ in instance.Role.choices)):
-            ParseError('Такой роли не существует!')
-        if current_role in (instance.Role.ADMIN, instance.Role.MANAGER):
-            instance.is_staff = True
+        if current_role not in User.ROLE_VALUES:
+            raise ParseError('Такой роли не существует!')
+        # Обновляем только колонку роли.
+        User.objects.filter(pk=instance.pk).update(role=current_role)
         instance.role = current_role
-        instance.save()
         return instance
 
 
@@ -129,8 +129,7 @@ class CustomUserViewSet(mixins.ExtendedUserViewSet):
     @action(methods=['POST'], detail=False)
     def change_password(self, request: Request) -> Response:
         """Method for changing the password."""
-        user = get_current_user()
-        serializer = self.get_serializer(instance=user, data=request.data)
+        serializer = self.get_serializer(instance=request.user, data=request.data)
         serializer.is_valid(raise_exception=True)
         serializer.save()
         return Response(status=status.HTTP_204_NO_CONTENT)
@@ -196,7 +195,15 @@ class CustomUserViewSet(mixins.ExtendedUserViewSet):
 )
 class UserListSearchView(mixins.ListViewSet):
     """User list view."""
-    queryset = User.objects.exclude(is_superuser=True)
+    queryset = User.objects.exclude(is_superuser=True).only(
+        'id',
+        'first_name',
+        'last_name',
+        'email',
+        'phone_number',
+        'username',
+        'is_active',
+    )
     serializer_class = user_s.UserListSearchSerializer
     filter_backends = (SearchFilter, OrderingFilter)
     search_fields = ('email', 'username')